@@ -7,6 +7,7 @@ import socket
 import sys
 from asyncio import DatagramTransport
 from asyncio.events import AbstractEventLoop
+from functools import lru_cache
 from ipaddress import IPv4Address, IPv6Address
 from typing import Any, Callable, Coroutine, Optional, cast
 
@@ -28,6 +29,15 @@ from async_upnp_client.utils import CaseInsensitiveDict
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _parse_target_ip(target: AddressTupleVXType) -> IPvXAddress:
+    """Parse the IP address from a target address tuple."""
+    if len(target) == 4:
+        return IPv6Address(target[0])
+
+    return IPv4Address(target[0])
+
+
 class SsdpSearchListener:  # pylint: disable=too-many-arguments,too-many-instance-attributes
     """SSDP Search (response) listener."""
 
@@ -123,10 +133,7 @@ class SsdpSearchListener:  # pylint: disable=too-many-arguments,too-many-instanc
     @property
     def target_ip(self) -> IPvXAddress:
         """Get target IP."""
-        if len(self.target) == 4:
-            return IPv6Address(self.target[0])
-
-        return IPv4Address(self.target[0])
+        return _parse_target_ip(self.target)
 
     async def async_start(self) -> None:
         """Start the listener."""
@@ -19,6 +19,7 @@ from typing import (
     Mapping,
     Optional,
     Tuple,
+    Union,
 )
 from urllib.parse import urlparse
 
@@ -220,32 +221,36 @@ class SsdpDevice:
 
 
 def same_headers_differ(
-    current_headers: CaseInsensitiveDict, new_headers: CaseInsensitiveDict
+    current_headers: Union[CaseInsensitiveDict, Mapping[str, Any]],
+    new_headers: Union[CaseInsensitiveDict, Mapping[str, Any]],
 ) -> bool:
-    """Compare headers present in both to see if anything interesting has changed."""
-    current_headers_dict = current_headers.as_dict()
-    new_headers_dict = new_headers.as_dict()
-    new_headers_case_map = new_headers.case_map()
-    current_headers_case_map = current_headers.case_map()
+    """Compare headers present in both to see if anything interesting has changed.
 
-    for lower_header, current_header in current_headers_case_map.items():
+    Accepts either CaseInsensitiveDicts or pre-lowered plain dicts, as
+    returned by `CaseInsensitiveDict.as_lower_dict`.
+    """
+    if isinstance(current_headers, CaseInsensitiveDict):
+        current_headers = current_headers.as_lower_dict()
+    if isinstance(new_headers, CaseInsensitiveDict):
+        new_headers = new_headers.as_lower_dict()
+    current_lower_dict = current_headers
+    get_new_value = new_headers.get
+
+    for lower_header, current_value in current_lower_dict.items():
         if (
             lower_header != "" and lower_header[0] == "_"
         ) or lower_header in IGNORED_HEADERS:
             continue
-        new_header = new_headers_case_map.get(lower_header, _SENTINEL)
-
-        if new_header is not _SENTINEL:
-            current_value = current_headers_dict[current_header]
-            new_value = new_headers_dict[new_header]  # type: ignore[index]
-            if current_value != new_value:
-                _LOGGER.debug(
-                    "Header %s changed from %s to %s",
-                    current_header,
-                    current_value,
-                    new_value,
-                )
-                return True
+        new_value = get_new_value(lower_header, _SENTINEL)
+
+        if new_value is not _SENTINEL and current_value != new_value:
+            _LOGGER.debug(
+                "Header %s changed from %s to %s",
+                lower_header,
+                current_value,
+                new_value,
+            )
+            return True
 
     return False
 
@@ -274,6 +279,7 @@ def headers_differ_from_existing_search(
     return same_headers_differ(headers_old, headers)
 
 
+@lru_cache(maxsize=128)
 def ip_version_from_location(location: str) -> Optional[int]:
     """Get the ip version for a location."""
     with suppress(ValueError):
@@ -644,5 +650,9 @@ class SsdpListener:
 
     @property
     def devices(self) -> Mapping[str, SsdpDevice]:
-        """Get the known devices."""
+        """Get the known devices.
+
+        Returns the tracker's live mapping without copying, so membership
+        tests and lookups are plain dict operations.
+        """
         return self._device_tracker.devices
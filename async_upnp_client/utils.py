@@ -9,6 +9,7 @@ from collections.abc import Mapping as abcMapping
 from collections.abc import MutableMapping as abcMutableMapping
 from datetime import datetime, timedelta, timezone
 from socket import AddressFamily  # pylint: disable=no-name-in-module
+from sys import intern
 from typing import Any, Callable, Dict, Generator, Optional, Tuple
 from urllib.parse import urljoin, urlsplit
 
@@ -68,17 +69,20 @@ class lowerstr(str):  # pylint: disable=invalid-name
 class CaseInsensitiveDict(abcMutableMapping):
     """Case insensitive dict."""
 
-    __slots__ = ("_data", "_case_map")
+    __slots__ = ("_data", "_case_map", "_lower_data")
 
     def __init__(self, data: Optional[abcMapping] = None, **kwargs: Any) -> None:
         """Initialize."""
         self._data: Dict[str, Any] = {**(data or {}), **kwargs}
+        # Intern the lowercase keys: the same header keys recur for every
+        # packet, so hashing them degrades to an identity check.
         self._case_map: Dict[str, Any] = {
             k
             if type(k) is lowerstr  # pylint: disable=unidiomatic-typecheck
-            else k.lower(): k
+            else intern(k.lower()): k
             for k in self._data
         }
+        self._lower_data: Optional[Dict[str, Any]] = None
 
     def copy(self) -> "CaseInsensitiveDict":
         """Copy a CaseInsensitiveDict.
@@ -89,6 +93,20 @@ class CaseInsensitiveDict(abcMutableMapping):
         _copy = CaseInsensitiveDict.__new__(CaseInsensitiveDict)
         _copy._data = self._data.copy()
         _copy._case_map = self._case_map.copy()
+        _copy._lower_data = None
+        return _copy
+
+    def copy_with(
+        self, data: Optional[abcMapping] = None, **kwargs: Any
+    ) -> "CaseInsensitiveDict":
+        """Copy a CaseInsensitiveDict and apply overrides to the copy.
+
+        Returns a copy of CaseInsensitiveDict with the overrides applied,
+        without re-normalizing the keys already present.
+        """
+        _copy = self.copy()
+        for key, value in {**(data or {}), **kwargs}.items():
+            _copy[key] = value
         return _copy
 
     def combine(self, other: "CaseInsensitiveDict") -> "CaseInsensitiveDict":
@@ -101,6 +119,7 @@ class CaseInsensitiveDict(abcMutableMapping):
         _combined = CaseInsensitiveDict.__new__(CaseInsensitiveDict)
         _combined._data = {**self._data, **other._data}
         _combined._case_map = {**self._case_map, **other._case_map}
+        _combined._lower_data = None
         return _combined
 
     def combine_lower_dict(
@@ -115,6 +134,7 @@ class CaseInsensitiveDict(abcMutableMapping):
         _combined = CaseInsensitiveDict.__new__(CaseInsensitiveDict)
         _combined._data = {**self._data, **lower_dict}  # type: ignore[dict-item]
         _combined._case_map = {**self._case_map, **{k: k for k in lower_dict}}
+        _combined._lower_data = None
         return _combined
 
     def case_map(self) -> Dict[str, str]:
@@ -126,8 +146,17 @@ class CaseInsensitiveDict(abcMutableMapping):
         return self._data
 
     def as_lower_dict(self) -> Dict[str, Any]:
-        """Return the underlying dict in lowercase."""
-        return {k.lower(): v for k, v in self._data.items()}
+        """Return the underlying dict in lowercase.
+
+        The returned dict is cached until this CaseInsensitiveDict is
+        mutated and must not be modified by the caller.
+        """
+        if self._lower_data is None:
+            data = self._data
+            self._lower_data = {
+                lower_key: data[key] for lower_key, key in self._case_map.items()
+            }
+        return self._lower_data
 
     def get_lower(self, lower_key: str, default: Any = None) -> Any:
         """Get a lower case key."""
@@ -143,23 +172,26 @@ class CaseInsensitiveDict(abcMutableMapping):
             self._case_map = {
                 k
                 if type(k) is lowerstr  # pylint: disable=unidiomatic-typecheck
-                else k.lower(): k
+                else intern(k.lower()): k
                 for k in self._data
             }
+        self._lower_data = None
 
     def del_lower(self, lower_key: str) -> None:
         """Delete a lower case key."""
         del self._data[self._case_map[lower_key]]
         del self._case_map[lower_key]
+        self._lower_data = None
 
     def __setitem__(self, key: str, value: Any) -> None:
         """Set item."""
-        lower_key = key.lower()
+        lower_key = intern(key.lower())
         if self._case_map.get(lower_key, key) != key:
             # Case changed
             del self._data[self._case_map[lower_key]]
         self._data[key] = value
         self._case_map[lower_key] = key
+        self._lower_data = None
 
     def __getitem__(self, key: str) -> Any:
         """Get item."""
@@ -170,6 +202,7 @@ class CaseInsensitiveDict(abcMutableMapping):
         lower_key = key.lower()
         del self._data[self._case_map[lower_key]]
         del self._case_map[lower_key]
+        self._lower_data = None
 
     def __len__(self) -> int:
         """Get length."""
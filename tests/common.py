@@ -1,9 +1,42 @@
 """Common test parts."""
 
 from datetime import datetime
+from typing import Any, List, Optional
+from unittest.mock import call
 
 from async_upnp_client.utils import CaseInsensitiveDict
 
+
+class FastAsyncCallback:
+    """Minimal awaitable callback stub, cheaper than an AsyncMock per await."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.calls: List[Any] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> None:
+        """Record an await of the callback."""
+        self.calls.append(call(*args, **kwargs))
+
+    @property
+    def await_args(self) -> Optional[Any]:
+        """Get the arguments of the last await, like AsyncMock.await_args."""
+        return self.calls[-1] if self.calls else None
+
+    def assert_awaited_once_with(self, *args: Any, **kwargs: Any) -> None:
+        """Assert the callback was awaited exactly once, with the given arguments."""
+        assert len(self.calls) == 1
+        assert self.calls[0] == call(*args, **kwargs)
+
+    def assert_not_awaited(self) -> None:
+        """Assert the callback was never awaited."""
+        assert not self.calls
+
+    def reset_mock(self) -> None:
+        """Clear the recorded awaits."""
+        self.calls.clear()
+
+
 ADVERTISEMENT_REQUEST_LINE = "NOTIFY * HTTP/1.1"
 ADVERTISEMENT_HEADERS_DEFAULT = CaseInsensitiveDict(
     {
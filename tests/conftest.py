@@ -3,15 +3,35 @@
 
 import asyncio
 import os.path
+import platform
 from collections import deque
 from copy import deepcopy
-from typing import Deque, Mapping, MutableMapping, Optional, Tuple, cast
+from typing import Deque, Iterator, Mapping, MutableMapping, Optional, Tuple, cast
+
+import pytest
 
 from async_upnp_client.client import UpnpRequester
 from async_upnp_client.const import AddressTupleVXType
 from async_upnp_client.event_handler import UpnpEventHandler, UpnpNotifyServer
 
 
+@pytest.fixture
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Provide an event loop for async tests, backed by uvloop where available."""
+    loop: Optional[asyncio.AbstractEventLoop] = None
+    if platform.system() != "Windows":
+        try:
+            import uvloop  # pylint: disable=import-outside-toplevel
+
+            loop = uvloop.new_event_loop()
+        except ImportError:
+            pass
+    if loop is None:
+        loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 def read_file(filename: str) -> str:
     """Read file."""
     path = os.path.join("tests", "fixtures", filename)
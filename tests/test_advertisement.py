@@ -5,7 +5,6 @@ from unittest.mock import AsyncMock
 import pytest
 
 from async_upnp_client.advertisement import SsdpAdvertisementListener
-from async_upnp_client.utils import CaseInsensitiveDict
 
 from .common import (
     ADVERTISEMENT_HEADERS_DEFAULT,
@@ -27,8 +26,7 @@ async def test_receive_ssdp_alive() -> None:
         async_on_byebye=async_on_byebye,
         async_on_update=async_on_update,
     )
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
-    headers["NTS"] = "ssdp:alive"
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy_with(NTS="ssdp:alive")
     listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
 
     async_on_alive.assert_called_with(headers)
@@ -48,8 +46,7 @@ async def test_receive_ssdp_byebye() -> None:
         async_on_byebye=async_on_byebye,
         async_on_update=async_on_update,
     )
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
-    headers["NTS"] = "ssdp:byebye"
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy_with(NTS="ssdp:byebye")
     listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
 
     async_on_alive.assert_not_called()
@@ -69,8 +66,7 @@ async def test_receive_ssdp_update() -> None:
         async_on_byebye=async_on_byebye,
         async_on_update=async_on_update,
     )
-    headers = CaseInsensitiveDict(ADVERTISEMENT_HEADERS_DEFAULT)
-    headers["NTS"] = "ssdp:update"
+    headers = ADVERTISEMENT_HEADERS_DEFAULT.copy_with(NTS="ssdp:update")
     listener._on_data(ADVERTISEMENT_REQUEST_LINE, headers)
 
     async_on_alive.assert_not_called()
@@ -90,7 +86,7 @@ async def test_receive_ssdp_search_response() -> None:
         async_on_byebye=async_on_byebye,
         async_on_update=async_on_update,
     )
-    headers = CaseInsensitiveDict(SEARCH_HEADERS_DEFAULT)
+    headers = SEARCH_HEADERS_DEFAULT.copy()
     listener._on_data(SEARCH_REQUEST_LINE, headers)
 
     async_on_alive.assert_not_called()
@@ -11,6 +11,7 @@ from typing import (
     Awaitable,
     Callable,
     Dict,
+    Iterator,
     Optional,
     Tuple,
 )
@@ -36,6 +37,14 @@ from async_upnp_client.server import (
 from .conftest import read_file
 
 
+@pytest.fixture
+def event_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    """Use the default event loop; uvloop cannot drive the AF_UNIX mock sockets."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
 class ServerServiceTest(UpnpServerService):
     """Test Service."""
 
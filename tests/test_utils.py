@@ -50,6 +50,30 @@ def test_case_insensitive_dict_profile() -> None:
         )
 
 
+def test_case_insensitive_dict_copy_with() -> None:
+    """Test CaseInsensitiveDict.copy_with."""
+    ci_dict = CaseInsensitiveDict({"Key": "value", "Other": "other_value"})
+    copy = ci_dict.copy_with(KEY="new_value", extra="extra_value")
+    assert copy == {"key": "new_value", "other": "other_value", "extra": "extra_value"}
+    assert ci_dict == {"key": "value", "other": "other_value"}
+
+    copy = ci_dict.copy_with({"Dotted.Key": "dotted_value"})
+    assert copy["dotted.key"] == "dotted_value"
+
+
+def test_case_insensitive_dict_as_lower_dict() -> None:
+    """Test CaseInsensitiveDict.as_lower_dict and its cache invalidation."""
+    ci_dict = CaseInsensitiveDict({"Key": "value"})
+    assert ci_dict.as_lower_dict() == {"key": "value"}
+    assert ci_dict.as_lower_dict() is ci_dict.as_lower_dict()
+
+    ci_dict["Other"] = "other_value"
+    assert ci_dict.as_lower_dict() == {"key": "value", "other": "other_value"}
+
+    del ci_dict["Key"]
+    assert ci_dict.as_lower_dict() == {"other": "other_value"}
+
+
 def test_case_insensitive_dict_equality() -> None:
     """Test CaseInsensitiveDict equality."""
     assert CaseInsensitiveDict(key="value") == CaseInsensitiveDict(KEY="value")